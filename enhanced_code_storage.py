@@ -6,12 +6,225 @@ This script provides a comprehensive system for storing and retrieving code patt
 the Qdrant memory system with enriched metadata, quality metrics, and versioning.
 """
 
+import ast
+import asyncio
+import bisect
+import functools
+import io
 import json
+import logging
 import sys
 import re
+import threading
+import time
+import tokenize
+import warnings
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union, Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Patterns for the Python heuristics, compiled once at import time
+_PY_CONTROL = r'\b(?:if|elif|else|for|while|with|try|except)\b'
+_PY_DOCSTRING = r'"""[\s\S]*?"""' r"|'''[\s\S]*?'''"
+_PY_FUNC = r'\bdef\s+\w+\s*\('
+_PY_CLASS = r'\bclass\s+\w+\s*[:\(]'
+
+_PY_CONTROL_RE = re.compile(_PY_CONTROL)
+_PY_DEFINITION_RE = re.compile(f'{_PY_FUNC}|{_PY_CLASS}')
+# Single-pass scanner; docstrings are matched as a whole so keywords inside
+# them are not counted
+_PY_TOKEN_RE = re.compile(
+    f'(?P<ctrl>{_PY_CONTROL})|(?P<doc>{_PY_DOCSTRING})'
+    f'|(?P<func>{_PY_FUNC})|(?P<cls>{_PY_CLASS})'
+)
+
+# Complexity levels and the highest cyclomatic complexity for each but the last
+_COMPLEXITY_LEVELS = ("simple", "intermediate", "advanced")
+_COMPLEXITY_THRESHOLDS = (5, 10)
+
+# Display templates for the search filters, in _describe_filters argument order
+_FILTER_TEMPLATES = (
+    "language='{}'", "complexity_level='{}'", "user_rating>={}", "tags include {}"
+)
+
+# Shared immutable default for missing tags/dependencies
+_EMPTY: Tuple[()] = ()
+
+# Runs of non-word characters collapse to "_" when building pattern IDs
+_SLUG_RE = re.compile(r'\W+')
+
+_PY_CONTROL_KEYWORDS = frozenset(
+    ("if", "elif", "else", "for", "while", "with", "try", "except")
+)
+# Tokens after which a string statement starts a block (None: start of module)
+_PY_DOCSTRING_PRECEDERS = frozenset((None, tokenize.INDENT, tokenize.NEWLINE))
+_PY_SKIPPED_TOKENS = frozenset((tokenize.NL, tokenize.COMMENT))
+
+# try/except* blocks (Python 3.11+) parse to ast.TryStar
+_PY_TRY_NODES = (ast.Try, ast.TryStar) if hasattr(ast, "TryStar") else (ast.Try,)
+_PY_BRANCH_NODES = (
+    ast.If, ast.For, ast.AsyncFor, ast.While,
+    ast.With, ast.AsyncWith, ast.ExceptHandler
+) + _PY_TRY_NODES
+_PY_ELSE_NODES = (ast.If, ast.For, ast.AsyncFor, ast.While) + _PY_TRY_NODES
+_PY_DEFINITION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# warnings.catch_warnings() swaps process-wide state, so parses that
+# suppress warnings must not overlap (store_many analyzes on worker threads)
+_PARSE_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=1024)
+def _analyze_python(code: str) -> Tuple[int, float]:
+    """
+    Return (complexity, doc_coverage) for Python code.
+    
+    The code is parsed once with ast and the tree is walked to count branch
+    points, definitions and their docstrings. Code that does not parse
+    (e.g. partial snippets) or is nested too deeply for the parser falls
+    back to the lexical heuristics.
+    A conditional expression counts twice, for its if and its else, so the
+    score matches the keyword counts of the fallbacks. Compiler warnings
+    about the snippet (e.g. invalid escape sequences) are suppressed.
+    Results are memoized on the code string, so re-storing an identical
+    snippet does not rescan it.
+    """
+    try:
+        with _PARSE_LOCK, warnings.catch_warnings():
+            warnings.simplefilter("ignore", SyntaxWarning)
+            warnings.simplefilter("ignore", DeprecationWarning)
+            tree = ast.parse(code)
+    except (SyntaxError, ValueError, MemoryError, RecursionError):
+        return _analyze_python_tokens(code)
+    
+    # Start with 1 for the function/method itself
+    complexity = 1
+    definition_count = documented_count = 0
+    for node in ast.walk(tree):
+        if isinstance(node, _PY_BRANCH_NODES):
+            complexity += 1
+            # An else branch counts too, unless it is just an elif
+            if (isinstance(node, _PY_ELSE_NODES) and node.orelse
+                    and not (len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If))):
+                complexity += 1
+        elif isinstance(node, ast.IfExp):
+            complexity += 2
+        elif isinstance(node, ast.comprehension):
+            complexity += 1 + len(node.ifs)
+        elif isinstance(node, _PY_DEFINITION_NODES):
+            definition_count += 1
+            if ast.get_docstring(node, clean=False) is not None:
+                documented_count += 1
+    
+    if definition_count == 0:
+        return complexity, 1.0  # No definitions to document
+    
+    return complexity, documented_count / definition_count
+
+def _analyze_python_tokens(code: str) -> Tuple[int, float]:
+    """
+    Return (complexity, doc_coverage) for Python code using the tokenizer.
+    
+    Keywords in strings and comments are ignored and there is no regex
+    backtracking. Code that cannot be tokenized falls back to the regex
+    heuristics.
+    """
+    control_count = docstring_count = definition_count = 0
+    previous_type = None
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(code).readline):
+            if token.type in _PY_SKIPPED_TOKENS:
+                continue
+            if token.type == tokenize.NAME:
+                if token.string in _PY_CONTROL_KEYWORDS:
+                    control_count += 1
+                elif token.string in ("def", "class"):
+                    definition_count += 1
+            elif (token.type == tokenize.STRING
+                    and previous_type in _PY_DOCSTRING_PRECEDERS
+                    and token.string.lstrip("rRuUbB")[:3] in ('"""', "'''")):
+                docstring_count += 1
+            previous_type = token.type
+    except (tokenize.TokenError, SyntaxError):
+        return _analyze_python_regex(code)
+    
+    # Start with 1 for the function/method itself
+    complexity = 1 + control_count
+    
+    if definition_count == 0:
+        return complexity, 1.0  # No definitions to document
+    
+    # Simple heuristic: assume one docstring per function/class is ideal
+    coverage = min(1.0, docstring_count / definition_count)
+    return complexity, coverage
+
+def _analyze_python_regex(code: str) -> Tuple[int, float]:
+    """Return (complexity, doc_coverage) for Python code using regexes."""
+    if _PY_DEFINITION_RE.search(code) is None:
+        # No definitions to document, so skip the (backtracking) docstring
+        # matching and only count control flow statements
+        return 1 + sum(1 for _ in _PY_CONTROL_RE.finditer(code)), 1.0
+    
+    # Simple heuristic: count control flow statements, docstrings and
+    # definitions in a single scan of the code
+    counts = {"ctrl": 0, "doc": 0, "func": 0, "cls": 0}
+    for match in _PY_TOKEN_RE.finditer(code):
+        counts[match.lastgroup] += 1
+    
+    # Start with 1 for the function/method itself
+    complexity = 1 + counts["ctrl"]
+    
+    total_definitions = counts["func"] + counts["cls"]
+    if total_definitions == 0:
+        return complexity, 1.0  # Only definitions were inside docstrings
+    
+    # Simple heuristic: assume one docstring per function/class is ideal
+    coverage = min(1.0, counts["doc"] / total_definitions)
+    return complexity, coverage
+
+def _analyze_default(code: str) -> Tuple[int, float]:
+    """Return default (complexity, doc_coverage) estimations for other languages."""
+    return 1, 0.5
+
+# Language-specific analyzers, keyed by lower-case language name
+_ANALYZERS = {
+    "python": _analyze_python,
+}
+
+@functools.lru_cache(maxsize=1)
+def _format_timestamp(seconds: int) -> str:
+    """Format a Unix timestamp (whole seconds) as a local ISO 8601 string."""
+    return datetime.fromtimestamp(seconds).isoformat()
+
+def _current_timestamp() -> str:
+    """
+    Return the current local time as an ISO 8601 string.
+    
+    Timestamps have one-second resolution, so patterns stored within the
+    same second reuse the already formatted string.
+    """
+    return _format_timestamp(int(time.time()))
+
+def _to_json(obj: Any) -> str:
+    """
+    Serialize obj as indented JSON, using orjson when it is installed.
+    
+    Non-ASCII text is written as-is on both paths, as orjson does. Values
+    orjson cannot encode (e.g. integers wider than 64 bits) go through json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
 class CodeQualityAnalyzer:
     """
     Analyzes code quality metrics before storage.
@@ -20,6 +233,32 @@ class CodeQualityAnalyzer:
     such as cyclomatic complexity, documentation coverage, and style conformance.
     """
     
+    @staticmethod
+    def analyze(code: str, language: str = "python") -> Tuple[int, float]:
+        """
+        Calculate cyclomatic complexity and documentation coverage together.
+        
+        Parameters:
+        -----------
+        code : str
+            The code to analyze
+        language : str
+            Programming language of the code (default: "python")
+            
+        Returns:
+        --------
+        tuple
+            (cyclomatic complexity, documentation coverage between 0 and 1)
+            
+        Note:
+        -----
+        The code is scanned once for all metrics. This is a simplified
+        implementation; in production, use language-specific tools such
+        as radon (Python) or escomplex (JavaScript).
+        """
+        analyzer = _ANALYZERS.get(language.lower(), _analyze_default)
+        return analyzer(code)
+    
     @staticmethod
     def calculate_cyclomatic_complexity(code: str, language: str = "python") -> int:
         """
@@ -42,22 +281,7 @@ class CodeQualityAnalyzer:
         This is a simplified implementation. In production, you would
         use language-specific tools like radon (Python), escomplex (JavaScript), etc.
         """
-        if language.lower() == "python":
-            # Simple heuristic: count control flow statements
-            # In production, use a proper tool like radon
-            control_statements = [
-                r'\bif\b', r'\belif\b', r'\belse\b', r'\bfor\b', 
-                r'\bwhile\b', r'\bwith\b', r'\btry\b', r'\bexcept\b'
-            ]
-            complexity = 1  # Start with 1 for the function/method itself
-            
-            for statement in control_statements:
-                complexity += len(re.findall(statement, code))
-            
-            return complexity
-        else:
-            # Default complexity estimation for other languages
-            return 1
+        return CodeQualityAnalyzer.analyze(code, language)[0]
     
     @staticmethod
     def calculate_doc_coverage(code: str, language: str = "python") -> float:
@@ -81,25 +305,88 @@ class CodeQualityAnalyzer:
         This is a simplified implementation. In production, use
         language-specific tools for more accurate measurement.
         """
-        if language.lower() == "python":
-            # Count docstrings
-            docstring_count = len(re.findall(r'"""[\s\S]*?"""', code))
-            docstring_count += len(re.findall(r"'''[\s\S]*?'''", code))
-            
-            # Count functions and classes
-            func_count = len(re.findall(r'\bdef\s+\w+\s*\(', code))
-            class_count = len(re.findall(r'\bclass\s+\w+\s*[:\(]', code))
-            
-            total_definitions = func_count + class_count
-            if total_definitions == 0:
-                return 1.0  # No definitions to document
-                
-            # Simple heuristic: assume one docstring per function/class is ideal
-            coverage = min(1.0, docstring_count / total_definitions)
-            return coverage
-        else:
-            # Default coverage estimation for other languages
-            return 0.5
+        return CodeQualityAnalyzer.analyze(code, language)[1]
+
+@dataclass
+class QualityMetrics:
+    """Quality metrics calculated for a stored code pattern."""
+    __slots__ = ("cyclomatic_complexity", "documentation_coverage")
+    
+    cyclomatic_complexity: int
+    documentation_coverage: float
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Return the metrics as a JSON-serializable dict."""
+        return {
+            "cyclomatic_complexity": self.cyclomatic_complexity,
+            "documentation_coverage": self.documentation_coverage
+        }
+
+@dataclass
+class VersionInfo:
+    """Versioning details of a stored code pattern."""
+    __slots__ = ("version", "previous_version_id", "change_log", "updated_at")
+    
+    version: int
+    previous_version_id: Optional[str]
+    change_log: Optional[str]
+    updated_at: str
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Return the version details as a JSON-serializable dict."""
+        return {
+            "version": self.version,
+            "previous_version_id": self.previous_version_id,
+            "change_log": self.change_log,
+            "updated_at": self.updated_at
+        }
+
+@dataclass
+class CodePattern:
+    """
+    A code pattern record with its metadata.
+    
+    Records are kept as slotted objects while being assembled and are only
+    converted to dicts by to_payload() when handed to storage.
+    """
+    __slots__ = (
+        "id", "name", "language", "code", "explanation", "tags",
+        "complexity_level", "dependencies", "quality_metrics",
+        "version_info", "user_rating"
+    )
+    
+    id: str
+    name: str
+    language: str
+    code: str
+    explanation: str
+    tags: Union[List[str], Tuple[()]]
+    complexity_level: str
+    dependencies: Union[List[str], Tuple[()]]
+    quality_metrics: QualityMetrics
+    version_info: VersionInfo
+    user_rating: Optional[float]
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Return the information object stored in Qdrant."""
+        information = {
+            "type": "code_pattern",
+            "name": self.name,
+            "language": self.language,
+            "code": self.code,
+            "explanation": self.explanation,
+            "tags": self.tags,
+            "complexity_level": self.complexity_level,
+            "dependencies": self.dependencies,
+            "quality_metrics": self.quality_metrics.to_payload(),
+            "version_info": self.version_info.to_payload()
+        }
+        
+        if self.user_rating is not None:
+            information["user_rating"] = self.user_rating
+        
+        information["id"] = self.id
+        return information
 
 class EnhancedCodeStorage:
     """
@@ -157,51 +444,142 @@ class EnhancedCodeStorage:
         dict
             Formatted information object ready for storage
         """
+        record = self._build_code_pattern(
+            name, code, explanation, language, tags, complexity_level,
+            dependencies, user_rating, version, previous_version_id, change_log
+        )
+        
+        # In a real implementation, this would call the qdrant-store-memory function
+        # For demonstration purposes, we just return the formatted object
+        logger.debug("Would store pattern '%s' (version %s) in Qdrant", name, version)
+        return record.to_payload()
+    
+    def store_code_patterns(
+        self,
+        patterns: List[Dict[str, Any]],
+        batch_size: int = 64
+    ) -> List[Dict[str, Any]]:
+        """
+        Store many code patterns, sending them to Qdrant in batches.
+        
+        Parameters:
+        -----------
+        patterns : list
+            Keyword arguments for store_code_pattern, one dict per pattern
+        batch_size : int, optional
+            Maximum number of patterns sent per upsert (default: 64)
+            
+        Returns:
+        --------
+        list
+            Formatted information objects, in the same order as patterns
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        stored = []
+        for start in range(0, len(patterns), batch_size):
+            # Keep the slotted records while the batch is assembled; they
+            # become dicts only when handed to storage
+            batch: List[CodePattern] = [
+                self._build_code_pattern(**pattern)
+                for pattern in patterns[start:start + batch_size]
+            ]
+            
+            # In a real implementation, each batch would be a single Qdrant upsert
+            logger.debug("Would store batch of %d patterns in Qdrant", len(batch))
+            stored.extend(record.to_payload() for record in batch)
+        return stored
+    
+    async def store_many(
+        self,
+        patterns: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Store code patterns concurrently from async code.
+        
+        Each pattern is stored with store_code_pattern in a worker thread, so
+        the event loop is not blocked while a store waits on I/O.
+        
+        Parameters:
+        -----------
+        patterns : list
+            Keyword arguments for store_code_pattern, one dict per pattern
+        max_concurrency : int, optional
+            Maximum number of stores in flight at once (default: 8)
+            
+        Returns:
+        --------
+        list
+            Formatted information objects, in the same order as patterns
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def store(pattern: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    None, functools.partial(self.store_code_pattern, **pattern)
+                )
+        
+        return list(await asyncio.gather(*(store(pattern) for pattern in patterns)))
+    
+    def _build_code_pattern(
+        self, 
+        name: str, 
+        code: str, 
+        explanation: str, 
+        language: str = "python", 
+        tags: Optional[List[str]] = None,
+        complexity_level: Optional[str] = None,
+        dependencies: Optional[List[str]] = None,
+        user_rating: Optional[float] = None,
+        version: int = 1,
+        previous_version_id: Optional[str] = None,
+        change_log: Optional[str] = None
+    ) -> CodePattern:
+        """
+        Build the record for a code pattern without storing it.
+        
+        Takes the same parameters as store_code_pattern.
+        """
         # Calculate quality metrics
-        cyclomatic_complexity = self.quality_analyzer.calculate_cyclomatic_complexity(code, language)
-        doc_coverage = self.quality_analyzer.calculate_doc_coverage(code, language)
+        cyclomatic_complexity, doc_coverage = self.quality_analyzer.analyze(code, language)
         
         # Determine complexity level if not provided
         if complexity_level is None:
-            if cyclomatic_complexity <= 5:
-                complexity_level = "simple"
-            elif cyclomatic_complexity <= 10:
-                complexity_level = "intermediate"
-            else:
-                complexity_level = "advanced"
-        
-        # Prepare full metadata
-        information = {
-            "type": "code_pattern",
-            "name": name,
-            "language": language,
-            "code": code,
-            "explanation": explanation,
-            "tags": tags or [],
-            "complexity_level": complexity_level,
-            "dependencies": dependencies or [],
-            "quality_metrics": {
-                "cyclomatic_complexity": cyclomatic_complexity,
-                "documentation_coverage": round(doc_coverage, 2)
-            },
-            "version_info": {
-                "version": version,
-                "previous_version_id": previous_version_id,
-                "change_log": change_log,
-                "updated_at": datetime.now().isoformat()
-            }
-        }
-        
-        if user_rating is not None:
-            information["user_rating"] = user_rating
+            complexity_level = _COMPLEXITY_LEVELS[
+                bisect.bisect_left(_COMPLEXITY_THRESHOLDS, cyclomatic_complexity)
+            ]
         
         # Assign a unique ID (in a real implementation this would be handled by Qdrant)
-        information["id"] = f"{name.lower().replace(' ', '_')}_{version}"
+        slug = _SLUG_RE.sub('_', name).lower().strip('_') or "pattern"
         
-        # In a real implementation, this would call the qdrant-store-memory function
-        # For demonstration purposes, we just return the formatted object
-        print(f"Would store pattern '{name}' (version {version}) in Qdrant")
-        return information
+        return CodePattern(
+            id=f"{slug}_{version}",
+            name=name,
+            language=language,
+            code=code,
+            explanation=explanation,
+            tags=tags if tags is not None else _EMPTY,
+            complexity_level=complexity_level,
+            dependencies=dependencies if dependencies is not None else _EMPTY,
+            quality_metrics=QualityMetrics(
+                cyclomatic_complexity=cyclomatic_complexity,
+                documentation_coverage=round(doc_coverage, 2)
+            ),
+            version_info=VersionInfo(
+                version=version,
+                previous_version_id=previous_version_id,
+                change_log=change_log,
+                updated_at=_current_timestamp()
+            ),
+            user_rating=user_rating
+        )
 
     def find_similar_code(
         self, 
@@ -232,35 +610,77 @@ class EnhancedCodeStorage:
         list
             List of matching code patterns (would be retrieved from Qdrant)
         """
-        # Build filter conditions for display purposes
-        filters = []
-        if language:
-            filters.append(f"language='{language}'")
-        if complexity_level:
-            filters.append(f"complexity_level='{complexity_level}'")
-        if min_rating:
-            filters.append(f"user_rating>={min_rating}")
-        if required_tags:
-            filters.append(f"tags include {required_tags}")
-        
-        filter_str = " AND ".join(filters)
-        if filter_str:
-            print(f"Would search Qdrant for: '{query}' WITH FILTERS: {filter_str}")
-        else:
-            print(f"Would search Qdrant for: '{query}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            filters = self._describe_filters(language, complexity_level, min_rating, required_tags)
+            logger.debug("Would search Qdrant for: '%s'%s", query, filters)
         
         # In a real implementation, this would call the qdrant-find-memories function
         # For demonstration purposes, we just return an empty list
         return []
-
-def main():
-    """Main function to demonstrate the enhanced utility."""
-    storage = EnhancedCodeStorage()
     
-    # Example usage
-    pattern = storage.store_code_pattern(
-        name="Binary search implementation",
-        code="""def binary_search(arr, target):
+    def find_similar_code_batch(
+        self,
+        queries: List[str],
+        language: Optional[str] = None,
+        complexity_level: Optional[str] = None,
+        min_rating: Optional[float] = None,
+        required_tags: Optional[List[str]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Find code patterns for several queries in one request.
+        
+        The filters are shared by all queries, so they are built once and
+        the whole batch is sent to Qdrant as a single search request.
+        
+        Parameters:
+        -----------
+        queries : list
+            Search queries describing the code patterns needed
+        language : str, optional
+            Filter by programming language
+        complexity_level : str, optional
+            Filter by complexity level
+        min_rating : float, optional
+            Minimum user rating
+        required_tags : list, optional
+            Tags that must be present in results
+            
+        Returns:
+        --------
+        list
+            One list of matching code patterns per query, in query order
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            filters = self._describe_filters(language, complexity_level, min_rating, required_tags)
+            logger.debug("Would batch search Qdrant for %d queries: %s%s", len(queries), queries, filters)
+        
+        # In a real implementation, this would be a single batched Qdrant query
+        # For demonstration purposes, we just return empty result lists
+        return [[] for _ in queries]
+    
+    @staticmethod
+    def _describe_filters(
+        language: Optional[str],
+        complexity_level: Optional[str],
+        min_rating: Optional[float],
+        required_tags: Optional[List[str]]
+    ) -> str:
+        """
+        Describe the active search filters for display.
+        
+        Only filters that are set are formatted. Returns an empty string
+        when no filter is active.
+        """
+        values = (language, complexity_level, min_rating, required_tags)
+        filters = " AND ".join(
+            template.format(value)
+            for template, value in zip(_FILTER_TEMPLATES, values)
+            if value
+        )
+        return f" WITH FILTERS: {filters}" if filters else ""
+
+# Example snippets used by the demo
+_BINARY_SEARCH_V1 = """def binary_search(arr, target):
     '''
     Perform binary search on a sorted array.
     
@@ -289,31 +709,9 @@ def main():
             right = mid - 1
     
     # Target is not present in the array
-    return -1""",
-        explanation="An efficient O(log n) algorithm for finding elements in a sorted array.",
-        language="python",
-        tags=["algorithm", "searching", "divide and conquer", "binary search"],
-        dependencies=["None - standard library only"],
-        user_rating=4.8
-    )
-    
-    print("\nStored pattern information:")
-    print(json.dumps(pattern, indent=2))
-    
-    print("\nRetrieving similar patterns:")
-    storage.find_similar_code(
-        query="efficient search algorithm for sorted data",
-        language="python",
-        complexity_level="intermediate",
-        min_rating=4.0,
-        required_tags=["algorithm", "searching"]
-    )
-    
-    # Example of storing an updated version
-    print("\nStoring updated version:")
-    updated_pattern = storage.store_code_pattern(
-        name="Binary search implementation",
-        code="""def binary_search(arr, target):
+    return -1"""
+
+_BINARY_SEARCH_V2 = """def binary_search(arr, target):
     '''
     Perform binary search on a sorted array.
     
@@ -349,7 +747,43 @@ def main():
             right = mid - 1
     
     # Target is not present in the array
-    return -1""",
+    return -1"""
+
+def main():
+    """Main function to demonstrate the enhanced utility."""
+    # Show the storage and search requests that would be sent to Qdrant
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+    
+    storage = EnhancedCodeStorage()
+    
+    # Example usage
+    pattern = storage.store_code_pattern(
+        name="Binary search implementation",
+        code=_BINARY_SEARCH_V1,
+        explanation="An efficient O(log n) algorithm for finding elements in a sorted array.",
+        language="python",
+        tags=["algorithm", "searching", "divide and conquer", "binary search"],
+        dependencies=["None - standard library only"],
+        user_rating=4.8
+    )
+    
+    print("\nStored pattern information:")
+    print(_to_json(pattern))
+    
+    print("\nRetrieving similar patterns:")
+    storage.find_similar_code(
+        query="efficient search algorithm for sorted data",
+        language="python",
+        complexity_level="intermediate",
+        min_rating=4.0,
+        required_tags=["algorithm", "searching"]
+    )
+    
+    # Example of storing an updated version
+    print("\nStoring updated version:")
+    updated_pattern = storage.store_code_pattern(
+        name="Binary search implementation",
+        code=_BINARY_SEARCH_V2,
         explanation="An efficient O(log n) algorithm for finding elements in a sorted array. This implementation uses bit shifting for calculating the middle index for better performance.",
         language="python",
         tags=["algorithm", "searching", "divide and conquer", "binary search", "optimization"],
@@ -361,7 +795,7 @@ def main():
     )
     
     print("\nUpdated pattern information:")
-    print(json.dumps(updated_pattern, indent=2))
+    print(_to_json(updated_pattern))
 
 if __name__ == "__main__":
     main()
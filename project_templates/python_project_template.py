@@ -8,9 +8,40 @@ best practices for documentation, testing, and code quality.
 
 import os
 import argparse
+import functools
+import json
 import subprocess
+from collections import Counter
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Any, Dict, Final, List, Optional, Set, Union
+
+# Number of threads used to write the generated files
+_WRITE_WORKERS: Final[int] = 8
+
+# Directory holding the file templates shipped with this script
+_TEMPLATE_DIR: Final[Path] = Path(__file__).resolve().parent / "assets"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(name: str) -> str:
+    """
+    Load a file template from the assets directory.
+    
+    Templates are read on first use and cached, so templates of disabled
+    features are never read.
+    
+    Parameters
+    ----------
+    name : str
+        File name of the template inside the assets directory
+    
+    Returns
+    -------
+    str
+        The template text
+    """
+    return (_TEMPLATE_DIR / name).read_text(encoding="utf-8")
 
 
 class ProjectTemplate:
@@ -21,6 +52,14 @@ class ProjectTemplate:
     structure, documentation templates, testing setup, and development tools.
     """
     
+    # README entries for each optional development tool, keyed by the flag enabling it
+    _TOOL_FRAGMENTS = (
+        ("use_black", "- [Black](https://black.readthedocs.io/) for code formatting"),
+        ("use_flake8", "- [Flake8](https://flake8.pycqa.org/) for code linting"),
+        ("use_mypy", "- [mypy](https://mypy.readthedocs.io/) for static type checking"),
+        ("include_tests", "- [pytest](https://docs.pytest.org/) for testing"),
+    )
+    
     def __init__(
         self,
         project_name: str,
@@ -74,242 +113,112 @@ class ProjectTemplate:
         
         # Base directory
         self.base_dir = Path(self.project_name)
+        
+        # Frequently used project directories
+        self._package_dir = self.base_dir / self.package_name
+        self._docs_dir = self.base_dir / "docs"
+        self._docs_pages_dir = self._docs_dir / "docs"
+        self._tests_dir = self.base_dir / "tests"
+        self._workflows_dir = self.base_dir / ".github" / "workflows"
+        
+        # Directories known to exist during a generate() run, so writes into
+        # them skip mkdir. It is reset by each run and not trusted outside
+        # one, as the tree may change in between. Only the thread calling the
+        # create_* methods touches this set (queued writes never create
+        # directories), so it needs no locking as long as each instance is
+        # driven from a single thread.
+        self._ensured_dirs: Set[Path] = set()
+        
+        # Files queued for writing while generate() runs (latest content wins)
+        self._pending_writes: Optional[Dict[Path, bytes]] = None
+        
+        # Values substituted into the file templates
+        self._context: Dict[str, str] = {
+            "project_name": self.project_name,
+            "package_name": self.package_name,
+            "description": self.description,
+            "author": self.author,
+            "email": self.email,
+        }
     
     def create_directories(self) -> None:
-        """Create the standard directory structure for the project."""
+        """
+        Create the standard directory structure for the project.
+        
+        Every directory the generator writes into is created here in one
+        pass, shallowest first, and remembered so later file writes skip
+        the directory check.
+        """
         # Create base directories
-        dirs = [
+        dirs = {
             self.base_dir,
-            self.base_dir / self.package_name,
-            self.base_dir / "docs",
+            self._package_dir,
+            self._docs_dir,
+            self._docs_pages_dir,
             self.base_dir / "scripts",
-        ]
+        }
         
         # Add tests directory if requested
         if self.include_tests:
-            dirs.append(self.base_dir / "tests")
+            dirs.add(self._tests_dir)
         
-        # Create all directories
-        for directory in dirs:
+        # Add CI workflows directory if requested
+        if self.include_ci:
+            dirs.update((self._workflows_dir.parent, self._workflows_dir))
+        
+        # Create all directories, parents before children
+        for directory in sorted(dirs, key=lambda d: len(d.parts)):
             directory.mkdir(parents=True, exist_ok=True)
-            
-        # Create empty __init__.py files
-        init_files = [
-            self.base_dir / self.package_name / "__init__.py",
-        ]
+        self._ensured_dirs.update(dirs)
         
+        # Create an empty tests/__init__.py; the package's __init__.py is
+        # written by create_package_files
         if self.include_tests:
-            init_files.append(self.base_dir / "tests" / "__init__.py")
-        
-        for init_file in init_files:
-            self._create_file(init_file, '')
+            self._create_file(self._tests_dir / "__init__.py", '')
     
     def create_readme(self) -> None:
         """Create a comprehensive README.md file."""
-        readme_content = f"""# {self.project_name}
-
-{self.description}
-
-## Installation
-
-```bash
-# Clone the repository
-git clone https://github.com/{self.author}/{self.project_name}.git
-cd {self.project_name}
-
-# Create a virtual environment
-python -m venv venv
-source venv/bin/activate  # On Windows: venv\\Scripts\\activate
-
-# Install the package in development mode
-pip install -e .
-```
-
-## Usage
-
-```python
-import {self.package_name}
-
-# Add examples here
-```
-
-## Development
-
-This project uses:
-"""
+        # Development tools, listed in the order of _TOOL_FRAGMENTS
+        tools = "\n".join(
+            fragment for flag, fragment in self._TOOL_FRAGMENTS if getattr(self, flag)
+        )
         
-        # Add development tools
-        tools = []
-        if self.use_black:
-            tools.append("- [Black](https://black.readthedocs.io/) for code formatting")
-        if self.use_flake8:
-            tools.append("- [Flake8](https://flake8.pycqa.org/) for code linting")
-        if self.use_mypy:
-            tools.append("- [mypy](https://mypy.readthedocs.io/) for static type checking")
-        if self.include_tests:
-            tools.append("- [pytest](https://docs.pytest.org/) for testing")
-        
-        readme_content += "\n".join(tools)
-        
-        # Add development setup instructions
-        readme_content += f"""
-
-### Development Setup
-
-```bash
-# Install development dependencies
-pip install -e ".[dev]"
-
-# Run tests
-pytest
-
-# Check code style
-black .
-flake8
-mypy {self.package_name}
-```
-"""
-        
-        # Add license information
-        readme_content += f"""
-## License
-
-MIT License
-
-## Author
-
-{self.author} <{self.email}>
-"""
+        readme_content = "".join([
+            self._render("readme.header.md.tmpl"),
+            tools,
+            # Development setup instructions and license information
+            self._render("readme.dev_setup.md.tmpl"),
+            self._render("readme.license.md.tmpl"),
+        ])
         
         self._create_file(self.base_dir / "README.md", readme_content)
     
     def create_setup_py(self) -> None:
         """Create setup.py file for package installation."""
-        setup_content = f"""#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-
-from setuptools import setup, find_packages
-
-setup(
-    name="{self.project_name}",
-    version="0.1.0",
-    description="{self.description}",
-    author="{self.author}",
-    author_email="{self.email}",
-    url="https://github.com/{self.author}/{self.project_name}",
-    packages=find_packages(exclude=["tests", "tests.*"]),
-    install_requires=[
-        # Add your package dependencies here
-    ],
-    extras_require={{
-        "dev": [
-            "pytest>=7.0.0",
-            {"'black>=22.1.0'," if self.use_black else ""}
-            {"'flake8>=4.0.1'," if self.use_flake8 else ""}
-            {"'mypy>=0.931'," if self.use_mypy else ""}
-        ],
-    }},
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-    ],
-    python_requires=">=3.8",
-)
-"""
+        setup_content = self._render(
+            "setup.py.tmpl",
+            black_requirement="'black>=22.1.0'," if self.use_black else "",
+            flake8_requirement="'flake8>=4.0.1'," if self.use_flake8 else "",
+            mypy_requirement="'mypy>=0.931'," if self.use_mypy else "",
+        )
         self._create_file(self.base_dir / "setup.py", setup_content)
     
     def create_gitignore(self) -> None:
         """Create .gitignore file."""
-        gitignore_content = """# Byte-compiled / optimized / DLL files
-__pycache__/
-*.py[cod]
-*$py.class
-
-# Distribution / packaging
-dist/
-build/
-*.egg-info/
-
-# Unit test / coverage reports
-htmlcov/
-.coverage
-.coverage.*
-.pytest_cache/
-
-# Virtual environments
-venv/
-env/
-
-# IDE files
-.idea/
-.vscode/
-*.swp
-*.swo
-
-# Environment variables
-.env
-
-# Jupyter Notebook
-.ipynb_checkpoints
-
-# OS specific files
-.DS_Store
-"""
-        self._create_file(self.base_dir / ".gitignore", gitignore_content)
+        self._create_file(self.base_dir / ".gitignore", _load_template("gitignore.tmpl"))
     
     def create_config_files(self) -> None:
         """Create configuration files for development tools."""
         # pyproject.toml for Black and build system
         if self.use_black:
-            pyproject_content = """[build-system]
-requires = ["setuptools>=42", "wheel"]
-build-backend = "setuptools.build_meta"
-
-[tool.black]
-line-length = 88
-target-version = ['py38']
-include = '\.pyi?$'
-exclude = '''
-/(
-    \.git
-  | \.hg
-  | \.mypy_cache
-  | \.tox
-  | \.venv
-  | _build
-  | buck-out
-  | build
-  | dist
-)/
-'''
-"""
-            self._create_file(self.base_dir / "pyproject.toml", pyproject_content)
+            self._create_file(self.base_dir / "pyproject.toml", _load_template("pyproject.toml.tmpl"))
         
         # setup.cfg for flake8 and mypy
-        setup_cfg_content = f"[metadata]\nname = {self.project_name}\n"
-        
-        if self.use_flake8:
-            setup_cfg_content += """
-[flake8]
-max-line-length = 88
-extend-ignore = E203
-exclude = .git,__pycache__,build,dist
-"""
-        
-        if self.use_mypy:
-            setup_cfg_content += """
-[mypy]
-python_version = 3.8
-warn_return_any = True
-warn_unused_configs = True
-disallow_untyped_defs = True
-disallow_incomplete_defs = True
-"""
+        setup_cfg_content = "".join([
+            self._render("setup.cfg.tmpl"),
+            _load_template("setup.cfg.flake8.tmpl") if self.use_flake8 else "",
+            _load_template("setup.cfg.mypy.tmpl") if self.use_mypy else "",
+        ])
         
         self._create_file(self.base_dir / "setup.cfg", setup_cfg_content)
     
@@ -318,251 +227,129 @@ disallow_incomplete_defs = True
         if not self.include_tests:
             return
         
-        test_content = f"""#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-
-\"\"\"
-Tests for `{self.package_name}` package.
-\"\"\"
-
-import pytest
-from {self.package_name} import __version__
-
-
-def test_version():
-    \"\"\"Test version is a string.\"\"\"
-    assert isinstance(__version__, str)
-"""
-        self._create_file(self.base_dir / "tests" / f"test_{self.package_name}.py", test_content)
+        test_content = self._render("test_package.py.tmpl")
+        self._create_file(self._tests_dir / f"test_{self.package_name}.py", test_content)
         
         # Create conftest.py
-        conftest_content = """#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-
-"""
-        self._create_file(self.base_dir / "tests" / "conftest.py", conftest_content)
+        self._create_file(self._tests_dir / "conftest.py", _load_template("conftest.py.tmpl"))
     
     def create_ci_config(self) -> None:
         """Create GitHub Actions workflow for CI."""
         if not self.include_ci:
             return
         
-        # Create .github/workflows directory
-        workflows_dir = self.base_dir / ".github" / "workflows"
-        workflows_dir.mkdir(parents=True, exist_ok=True)
-        
-        ci_content = f"""name: Python CI
-
-on:
-  push:
-    branches: [ main, master ]
-  pull_request:
-    branches: [ main, master ]
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    strategy:
-      matrix:
-        python-version: [3.8, 3.9, '3.10']
-
-    steps:
-    - uses: actions/checkout@v2
-    - name: Set up Python ${{{{ matrix.python-version }}}}
-      uses: actions/setup-python@v2
-      with:
-        python-version: ${{{{ matrix.python-version }}}}
-    - name: Install dependencies
-      run: |
-        python -m pip install --upgrade pip
-        pip install -e ".[dev]"
-    - name: Lint with flake8
-      if: ${'true' if self.use_flake8 else 'false'}
-      run: |
-        flake8 {self.package_name} tests
-    - name: Check formatting with black
-      if: ${'true' if self.use_black else 'false'}
-      run: |
-        black --check {self.package_name} tests
-    - name: Type check with mypy
-      if: ${'true' if self.use_mypy else 'false'}
-      run: |
-        mypy {self.package_name}
-    - name: Test with pytest
-      run: |
-        pytest
-"""
-        self._create_file(workflows_dir / "python-ci.yml", ci_content)
+        ci_content = self._render(
+            "python-ci.yml.tmpl",
+            flake8_enabled="true" if self.use_flake8 else "false",
+            black_enabled="true" if self.use_black else "false",
+            mypy_enabled="true" if self.use_mypy else "false",
+        )
+        self._create_file(self._workflows_dir / "python-ci.yml", ci_content)
     
     def create_docs(self) -> None:
         """Create basic documentation structure with MkDocs."""
         # Create mkdocs.yml
-        mkdocs_content = f"""site_name: {self.project_name}
-site_description: {self.description}
-site_author: {self.author}
-
-theme:
-  name: material
-
-plugins:
-  - search
-  - mkdocstrings:
-      handlers:
-        python:
-          setup_commands:
-            - import sys
-            - sys.path.append(".")
-
-nav:
-  - Home: index.md
-  - Installation: installation.md
-  - Usage: usage.md
-  - API Reference: api.md
-  - Contributing: contributing.md
-  - License: license.md
-
-markdown_extensions:
-  - pymdownx.highlight
-  - pymdownx.superfences
-  - pymdownx.inlinehilite
-  - pymdownx.tabbed
-  - pymdownx.critic
-  - pymdownx.tasklist:
-      custom_checkbox: true
-"""
+        mkdocs_content = self._render("mkdocs.yml.tmpl")
         self._create_file(self.base_dir / "mkdocs.yml", mkdocs_content)
         
         # Create docs/index.md
-        index_content = f"""# {self.project_name}
-
-{self.description}
-
-## Features
-
-* TODO
-
-## Installation
-
-```bash
-pip install {self.project_name}
-```
-
-## Quick Start
-
-```python
-import {self.package_name}
-
-# Add examples here
-```
-"""
-        docs_dir = self.base_dir / "docs" / "docs"
-        docs_dir.mkdir(parents=True, exist_ok=True)
-        self._create_file(docs_dir / "index.md", index_content)
+        index_content = self._render("docs.index.md.tmpl")
+        self._create_file(self._docs_pages_dir / "index.md", index_content)
         
         # Create other documentation files
-        self._create_file(docs_dir / "installation.md", "# Installation\n\n## From PyPI\n\n```bash\npip install " + self.project_name + "\n```\n\n## From Source\n\n```bash\ngit clone https://github.com/" + self.author + "/" + self.project_name + ".git\ncd " + self.project_name + "\npip install -e .\n```\n")
-        self._create_file(docs_dir / "usage.md", "# Usage\n\n## Basic Usage\n\n```python\nimport " + self.package_name + "\n\n# Add examples here\n```\n")
-        self._create_file(docs_dir / "api.md", f"# API Reference\n\n## {self.package_name}\n\n::: {self.package_name}\n")
-        self._create_file(docs_dir / "contributing.md", "# Contributing\n\n## Development Environment\n\n```bash\n# Clone the repository\ngit clone https://github.com/" + self.author + "/" + self.project_name + ".git\ncd " + self.project_name + "\n\n# Create a virtual environment\npython -m venv venv\nsource venv/bin/activate  # On Windows: venv\\Scripts\\activate\n\n# Install development dependencies\npip install -e \".[dev]\"\n```\n\n## Running Tests\n\n```bash\npytest\n```\n\n## Code Style\n\nThis project uses Black for code formatting, Flake8 for linting, and mypy for type checking.\n\n```bash\nblack .\nflake8\nmypy " + self.package_name + "\n```\n")
-        self._create_file(docs_dir / "license.md", "# License\n\nMIT License\n\nCopyright (c) 2025 " + self.author + "\n")
+        self._create_file(self._docs_pages_dir / "installation.md", self._render("docs.installation.md.tmpl"))
+        self._create_file(self._docs_pages_dir / "usage.md", self._render("docs.usage.md.tmpl"))
+        self._create_file(self._docs_pages_dir / "api.md", self._render("docs.api.md.tmpl"))
+        self._create_file(self._docs_pages_dir / "contributing.md", self._render("docs.contributing.md.tmpl"))
+        self._create_file(self._docs_pages_dir / "license.md", self._render("docs.license.md.tmpl"))
     
     def create_package_files(self) -> None:
         """Create basic files for the package."""
         # Create __init__.py with version
-        init_content = f"""\"\"\"
-{self.description}
-\"\"\"
-
-__version__ = "0.1.0"
-"""
-        self._create_file(self.base_dir / self.package_name / "__init__.py", init_content)
+        init_content = self._render("package_init.py.tmpl")
+        self._create_file(self._package_dir / "__init__.py", init_content)
         
         # Create a core module
-        core_content = f"""\"\"\"
-Core functionality for {self.project_name}.
-\"\"\"
-
-def hello_world() -> str:
-    \"\"\"
-    Return a greeting message.
-    
-    Returns
-    -------
-    str
-        A friendly greeting
-    
-    Examples
-    --------
-    >>> hello_world()
-    'Hello, World!'
-    """
-    return "Hello, World!"
-"""
-        self._create_file(self.base_dir / self.package_name / "core.py", core_content)
+        core_content = self._render("core.py.tmpl")
+        self._create_file(self._package_dir / "core.py", core_content)
     
     def create_pre_commit_hooks(self) -> None:
         """Create pre-commit hooks configuration."""
-        precommit_content = """repos:
--   repo: https://github.com/pre-commit/pre-commit-hooks
-    rev: v4.1.0
-    hooks:
-    -   id: trailing-whitespace
-    -   id: end-of-file-fixer
-    -   id: check-yaml
-    -   id: check-added-large-files
-
-"""
-        
-        if self.use_black:
-            precommit_content += """-   repo: https://github.com/psf/black
-    rev: 22.1.0
-    hooks:
-    -   id: black
-        language_version: python3
-
-"""
-        
-        if self.use_flake8:
-            precommit_content += """-   repo: https://github.com/pycqa/flake8
-    rev: 4.0.1
-    hooks:
-    -   id: flake8
-        additional_dependencies: [flake8-docstrings]
-
-"""
-        
-        if self.use_mypy:
-            precommit_content += """-   repo: https://github.com/pre-commit/mirrors-mypy
-    rev: v0.931
-    hooks:
-    -   id: mypy
-        additional_dependencies: [types-requests]
-"""
+        precommit_content = "".join([
+            _load_template("pre-commit-config.base.yaml.tmpl"),
+            _load_template("pre-commit-config.black.yaml.tmpl") if self.use_black else "",
+            _load_template("pre-commit-config.flake8.yaml.tmpl") if self.use_flake8 else "",
+            _load_template("pre-commit-config.mypy.yaml.tmpl") if self.use_mypy else "",
+        ])
         
         self._create_file(self.base_dir / ".pre-commit-config.yaml", precommit_content)
     
     def initialize_git(self) -> None:
         """Initialize Git repository."""
+        self._finish_git_init(self._start_git_init())
+    
+    def create_virtual_environment(self) -> None:
+        """Create a virtual environment for the project."""
+        self._finish_virtual_environment(self._start_virtual_environment())
+    
+    def _start_git_init(self) -> Optional[subprocess.Popen]:
+        """Start ``git init`` in the project directory without waiting for it."""
         try:
-            subprocess.run(["git", "init"], cwd=self.base_dir, check=True)
-            print(f"Initialized Git repository in {self.base_dir}")
-        except subprocess.CalledProcessError:
-            print("Failed to initialize Git repository. Make sure Git is installed.")
+            return subprocess.Popen(["git", "init"], cwd=self.base_dir)
         except FileNotFoundError:
             print("Git command not found. Make sure Git is installed and in your PATH.")
+            return None
     
-    def create_virtual_environment(self) -> None:
-        """Create a virtual environment for the project."""
+    def _finish_git_init(self, process: Optional[subprocess.Popen]) -> None:
+        """Wait for ``git init`` started by _start_git_init and report the result."""
+        if process is None:
+            return
+        
+        if process.wait() == 0:
+            print(f"Initialized Git repository in {self.base_dir}")
+        else:
+            print("Failed to initialize Git repository. Make sure Git is installed.")
+    
+    def _start_virtual_environment(self) -> Optional[subprocess.Popen]:
+        """Start creating the virtual environment without waiting for it."""
         if not self.use_venv:
+            return None
+        
+        return subprocess.Popen(["python", "-m", "venv", "venv"], cwd=self.base_dir)
+    
+    def _finish_virtual_environment(self, process: Optional[subprocess.Popen]) -> None:
+        """Wait for the virtual environment creation and report the result."""
+        if process is None:
             return
-            
-        try:
-            subprocess.run(["python", "-m", "venv", "venv"], cwd=self.base_dir, check=True)
+        
+        if process.wait() == 0:
             print(f"Created virtual environment in {self.base_dir / 'venv'}")
-        except subprocess.CalledProcessError:
+        else:
             print("Failed to create virtual environment.")
     
-    def _create_file(self, path: Path, content: str) -> None:
+    def _render(self, name: str, **extra: str) -> str:
+        """
+        Render a file template with the project context.
+        
+        Parameters
+        ----------
+        name : str
+            File name of a template in the assets directory, using
+            ``{name}`` placeholders (literal braces are doubled, as in f-strings)
+        **extra : str
+            Additional values for this template only
+        
+        Returns
+        -------
+        str
+            The rendered content
+        """
+        template = _load_template(name)
+        if extra:
+            return template.format_map({**self._context, **extra})
+        return template.format_map(self._context)
+    
+    def _create_file(self, path: Path, content: Union[str, bytes]) -> None:
         """
         Create a file with the given content.
         
@@ -570,40 +357,139 @@ def hello_world() -> str:
         ----------
         path : Path
             Path to the file
-        content : str
-            Content to write to the file
+        content : str or bytes
+            Content to write to the file; text is encoded as UTF-8
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        
+        parent = path.parent
+        
+        # Outside generate() the directories may have changed, so always check
+        if self._pending_writes is None:
+            parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            return
+        
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            # mkdir(parents=True) guarantees every ancestor exists as well
+            self._ensured_dirs.add(parent)
+            self._ensured_dirs.update(parent.parents)
+        
+        # While generating, writes are queued and flushed together
+        self._pending_writes[path] = data
+    
+    def _write_pending_files(self, executor: Optional[Executor] = None) -> None:
+        """
+        Write all queued files concurrently and clear the queue.
+        
+        Parameters
+        ----------
+        executor : Executor, optional
+            Executor to write with; by default a pool of _WRITE_WORKERS
+            threads is created for this call
+        """
+        pending = self._pending_writes or {}
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as own_executor:
+                self._write_pending_files(own_executor)
+            return
+        
+        # Consume the results so any write error is raised here
+        list(executor.map(lambda item: item[0].write_bytes(item[1]), pending.items()))
+        pending.clear()
+    
+    @classmethod
+    def generate_many(cls, specs: List[Dict[str, Any]], max_workers: int = 8) -> None:
+        """
+        Generate several projects concurrently.
+        
+        All projects share the module-level templates, so only rendering and
+        writing are repeated per project. File writes of all projects go
+        through one shared pool of _WRITE_WORKERS threads.
+        
+        Parameters
+        ----------
+        specs : list of dict
+            Keyword arguments for ProjectTemplate, one dict per project
+        max_workers : int, optional
+            Maximum number of projects generated at once, by default 8
+        
+        Raises
+        ------
+        ValueError
+            If a spec has missing or unknown arguments, or two specs share a
+            project_name (they would write into the same directory). Specs
+            are checked before any project is generated.
+        """
+        if not specs:
+            return
+        
+        templates = []
+        for index, spec in enumerate(specs):
+            try:
+                templates.append(cls(**spec))
+            except TypeError as e:
+                raise ValueError(f"Invalid project spec #{index + 1}: {e}") from e
+        
+        name_counts = Counter(template.project_name for template in templates)
+        duplicates = sorted(name for name, count in name_counts.items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate project names: {', '.join(duplicates)}")
+        
+        # Writers get their own pool: project workers block on their writes,
+        # so sharing one pool could leave no thread free to write
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as writer, \
+                ThreadPoolExecutor(max_workers=min(max_workers, len(templates))) as executor:
+            # Consume the results so any generation error is raised here
+            list(executor.map(lambda template: template.generate(writer), templates))
     
-    def generate(self) -> None:
-        """Generate the complete project structure."""
+    def generate(self, executor: Optional[Executor] = None) -> None:
+        """
+        Generate the complete project structure.
+        
+        Parameters
+        ----------
+        executor : Executor, optional
+            Executor for the file writes, shared when generating several
+            projects; by default a pool is created for this project
+        """
         print(f"Generating project structure for {self.project_name}...")
         
-        # Create directories and files
-        self.create_directories()
-        self.create_readme()
-        self.create_setup_py()
-        self.create_gitignore()
-        self.create_config_files()
-        self.create_test_files()
-        self.create_ci_config()
-        self.create_docs()
-        self.create_package_files()
-        self.create_pre_commit_hooks()
-        
-        # Initialize Git repository and virtual environment
-        self.initialize_git()
-        self.create_virtual_environment()
+        # Create directories and files; file writes are queued by _create_file
+        # and written concurrently once all contents are known
+        self._pending_writes = {}
+        self._ensured_dirs.clear()
+        try:
+            self.create_directories()
+            self.create_readme()
+            self.create_setup_py()
+            self.create_gitignore()
+            self.create_config_files()
+            self.create_test_files()
+            self.create_ci_config()
+            self.create_docs()
+            self.create_package_files()
+            self.create_pre_commit_hooks()
+            self._write_pending_files(executor)
+        finally:
+            self._pending_writes = None
+        
+        # Initialize Git repository and virtual environment once all files exist;
+        # the two are independent, so run them side by side
+        git_process = self._start_git_init()
+        venv_process = self._start_virtual_environment()
+        self._finish_git_init(git_process)
+        self._finish_virtual_environment(venv_process)
         
         print(f"Project {self.project_name} generated successfully!")
 
 
-def main() -> None:
-    """Run the project template generator."""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once and reuse it on later calls."""
     parser = argparse.ArgumentParser(description="Generate a Python project structure with best practices.")
-    parser.add_argument("project_name", help="Name of the project")
+    parser.add_argument("project_name", nargs="?", help="Name of the project")
     parser.add_argument("--description", default="A Python project", help="Short description of the project")
     parser.add_argument("--author", default="Your Name", help="Author's name")
     parser.add_argument("--email", default="your.email@example.com", help="Author's email")
@@ -613,21 +499,57 @@ def main() -> None:
     parser.add_argument("--no-flake8", action="store_true", help="Don't set up Flake8 for linting")
     parser.add_argument("--no-mypy", action="store_true", help="Don't set up mypy for type checking")
     parser.add_argument("--no-ci", action="store_true", help="Don't set up GitHub Actions CI")
-    
+    parser.add_argument(
+        "--batch",
+        metavar="SPECS_JSON",
+        help=(
+            "Generate every project described in a JSON file holding a list of "
+            "ProjectTemplate arguments; the other options set defaults for each spec"
+        )
+    )
+    return parser
+
+
+def main() -> None:
+    """Run the project template generator."""
+    parser = _build_parser()
     args = parser.parse_args()
     
-    template = ProjectTemplate(
-        project_name=args.project_name,
-        description=args.description,
-        author=args.author,
-        email=args.email,
-        use_venv=not args.no_venv,
-        include_tests=not args.no_tests,
-        use_black=not args.no_black,
-        use_flake8=not args.no_flake8,
-        use_mypy=not args.no_mypy,
-        include_ci=not args.no_ci
-    )
+    # Options shared by single and batch generation
+    options = {
+        "description": args.description,
+        "author": args.author,
+        "email": args.email,
+        "use_venv": not args.no_venv,
+        "include_tests": not args.no_tests,
+        "use_black": not args.no_black,
+        "use_flake8": not args.no_flake8,
+        "use_mypy": not args.no_mypy,
+        "include_ci": not args.no_ci,
+    }
+    
+    if args.batch:
+        if args.project_name is not None:
+            parser.error("project_name cannot be combined with --batch")
+        try:
+            with open(args.batch, encoding="utf-8") as f:
+                specs = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot read --batch file: {e}")
+        if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+            parser.error("--batch file must hold a JSON list of objects")
+        
+        # Command-line options are defaults; each spec may override them
+        try:
+            ProjectTemplate.generate_many([{**options, **spec} for spec in specs])
+        except ValueError as e:
+            parser.error(str(e))
+        return
+    
+    if args.project_name is None:
+        parser.error("project_name is required unless --batch is given")
+    
+    template = ProjectTemplate(project_name=args.project_name, **options)
     
     template.generate()
 
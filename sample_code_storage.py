@@ -7,9 +7,42 @@ It provides utility functions for formatting code patterns with proper metadata
 """
 
 import json
+import logging
 import sys
 
-def store_code_pattern(name, code, explanation, language="python", tags=None):
+try:
+    import orjson
+except ImportError:  # without orjson, _to_json uses the json module
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+def _to_json(obj):
+    """
+    Serialize obj as indented JSON, using orjson when it is installed.
+    
+    Non-ASCII text is written as-is on both paths, as orjson does. Values
+    orjson cannot encode (e.g. integers wider than 64 bits) go through json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _build_pattern(name, code, explanation, language="python", tags=None):
+    """Build the information object for a code pattern without storing it."""
+    return {
+        "type": "code_pattern",
+        "name": name,
+        "language": language,
+        "code": code,
+        "explanation": explanation,
+        "tags": tags or []
+    }
+
+def store_code_pattern(name, code, explanation, language="python", tags=None, verbose=False):
     """
     Store a code pattern in Qdrant memory system.
     
@@ -25,6 +58,8 @@ def store_code_pattern(name, code, explanation, language="python", tags=None):
         Programming language of the code (default: "python")
     tags : list, optional
         List of relevant tags for better retrieval
+    verbose : bool, optional
+        Log the store at INFO instead of DEBUG level (default: False)
         
     Returns:
     --------
@@ -41,20 +76,79 @@ def store_code_pattern(name, code, explanation, language="python", tags=None):
     ... )
     >>> print(pattern)
     """
-    information = {
-        "type": "code_pattern",
-        "name": name,
-        "language": language,
-        "code": code,
-        "explanation": explanation,
-        "tags": tags or []
-    }
+    information = _build_pattern(name, code, explanation, language, tags)
     
     # In a real implementation, this would call the qdrant-store-memory function
     # For demonstration purposes, we just return the formatted object
-    print(f"Would store pattern '{name}' in Qdrant")
+    logger.log(logging.INFO if verbose else logging.DEBUG, "Would store pattern '%s' in Qdrant", name)
     return information
 
+class CodePatternStore:
+    """
+    Buffer code patterns and store them in Qdrant in batches.
+    
+    Seeding a pattern library one store call per pattern pays a round trip
+    each time; this class collects patterns and sends them together,
+    flushing automatically whenever the buffer reaches batch_size.
+    
+    Example:
+    --------
+    >>> with CodePatternStore() as store:
+    ...     store.add("Binary search implementation", "def binary_search(arr, target): ...",
+    ...               "An efficient O(log n) algorithm for finding elements in a sorted array.")
+    """
+    
+    def __init__(self, batch_size=256):
+        """
+        Create an empty store.
+        
+        Parameters:
+        -----------
+        batch_size : int, optional
+            Number of buffered patterns that triggers a flush (default: 256)
+        """
+        self.batch_size = batch_size
+        self._buffer = []
+    
+    def add(self, name, code, explanation, language="python", tags=None):
+        """
+        Buffer a code pattern, flushing if the batch is full.
+        
+        Takes the same parameters as store_code_pattern.
+        
+        Returns:
+        --------
+        dict
+            Formatted information object that will be stored
+        """
+        information = _build_pattern(name, code, explanation, language, tags)
+        self._buffer.append(information)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+        return information
+    
+    def flush(self):
+        """
+        Store all buffered patterns in a single batch.
+        
+        Returns:
+        --------
+        list
+            The information objects that were stored
+        """
+        batch, self._buffer = self._buffer, []
+        if batch:
+            # In a real implementation, this would be a single Qdrant upsert
+            # For demonstration purposes, we just report the batch
+            logger.debug("Would store batch of %d patterns in Qdrant", len(batch))
+        return batch
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
 def find_similar_code(query):
     """
     Find code patterns similar to the provided query.
@@ -81,6 +175,8 @@ def find_similar_code(query):
 
 def main():
     """Main function to demonstrate the utility."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     # Example usage
     pattern = store_code_pattern(
         "Context manager implementation",
@@ -98,11 +194,12 @@ def main():
         if self.file:
             self.file.close()""",
         "A context manager for automatic resource management of file handles.",
-        tags=["resource management", "file handling", "context manager"]
+        tags=["resource management", "file handling", "context manager"],
+        verbose=True
     )
     
     print("\nStored pattern information:")
-    print(json.dumps(pattern, indent=2))
+    print(_to_json(pattern))
     
     print("\nRetrieving similar patterns:")
     find_similar_code("python context manager for files")